@@ -3,14 +3,29 @@
 Clock - A wrapper around timewarrior (timew) with improved readability and 12-hour format.
 """
 
+import calendar
 import subprocess
 import sys
 import re
-from datetime import datetime
-from typing import List
+import time
+from bisect import bisect_right
+from datetime import date, datetime
+from typing import List, NamedTuple, Optional, Tuple
 
 __version__ = "1.2.0"
 
+# Ordinal of 1970-01-01, used to turn epoch day numbers into dates
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# Step used when scanning for UTC offset changes (see build_utc_offset_table)
+OFFSET_SCAN_STEP = 86400
+
+# 12-hour labels for every minute of the day (0 -> "12:00am", 1439 -> "11:59pm")
+MINUTE_LABELS = [
+    f"{(minute // 60) % 12 or 12}:{minute % 60:02d}{'am' if minute < 720 else 'pm'}"
+    for minute in range(1440)
+]
+
 
 def convert_24h_to_12h(time_str: str) -> str:
     """Convert 24-hour format time to 12-hour format (only for times of day, not durations)."""
@@ -73,6 +88,118 @@ def convert_datetime_to_12h(dt_str: str) -> str:
     return dt_str
 
 
+def parse_timew_timestamp(stamp: str) -> int:
+    """Convert a timewarrior UTC timestamp (YYYYMMDDTHHMMSSZ) to epoch seconds."""
+    return calendar.timegm((int(stamp[0:4]), int(stamp[4:6]), int(stamp[6:8]),
+                            int(stamp[9:11]), int(stamp[11:13]), int(stamp[13:15])))
+
+
+def local_utc_offset(epoch: int) -> int:
+    """Return the local UTC offset in seconds in effect at the given epoch second."""
+    return time.localtime(epoch).tm_gmtoff
+
+
+class OffsetTable(NamedTuple):
+    """Local UTC offset transitions covering the epoch range [start, end].
+
+    offsets[i] applies from transitions[i] up to transitions[i + 1] (or end).
+    """
+    start: int
+    end: int
+    transitions: List[int]
+    offsets: List[int]
+
+
+def build_utc_offset_table(start: int, end: int) -> OffsetTable:
+    """Precompute local UTC offset transitions between two epoch seconds.
+
+    The range is probed every OFFSET_SCAN_STEP seconds and each change is
+    narrowed to the exact second with a binary search. This assumes no two
+    offset changes happen within one step of each other: a pair that cancels
+    out between probes would not be recorded. No real DST rule comes close.
+    """
+    transitions = [start]
+    offsets = [local_utc_offset(start)]
+    prev = start
+    while prev < end:
+        probe = min(prev + OFFSET_SCAN_STEP, end)
+        offset = local_utc_offset(probe)
+        if offset != offsets[-1]:
+            # Binary search for the first second using the new offset
+            lo, hi = prev, probe
+            while hi - lo > 1:
+                mid = (lo + hi) // 2
+                if local_utc_offset(mid) == offsets[-1]:
+                    lo = mid
+                else:
+                    hi = mid
+            transitions.append(hi)
+            offsets.append(offset)
+        prev = probe
+    return OffsetTable(start, end, transitions, offsets)
+
+
+def convert_epochs_to_local_12h(
+    epochs: List[int],
+    table: Optional[OffsetTable] = None,
+) -> Tuple[List[str], List[str]]:
+    """Convert UTC epoch seconds to local dates and 12-hour times in bulk.
+
+    Returns parallel lists of YYYY-MM-DD dates and times like "9:46am". The
+    offset table is built once for the whole batch. Consecutive epochs that
+    share a local day and UTC offset reuse the previous lookup, so sorted input
+    (as timew reports it) only hits bisect at day or DST boundaries. Each
+    timestamp gets the offset in effect at that instant, so the start and end
+    of an interval crossing a DST change are both converted correctly.
+
+    Args:
+        epochs: UTC epoch seconds to convert
+        table: Table from build_utc_offset_table() covering the queried range;
+            built from the batch's min/max when omitted
+
+    Raises:
+        ValueError: If an epoch falls outside the table's [start, end] range
+    """
+    if table is None:
+        if not epochs:
+            return [], []
+        table = build_utc_offset_table(min(epochs), max(epochs))
+    start, end, transitions, offsets = table
+    last_index = len(transitions) - 1
+
+    dates = []
+    times = []
+    add_date = dates.append
+    add_time = times.append
+    labels = MINUTE_LABELS
+    date_cache = {}
+
+    # Current run: epochs in [run_lo, run_hi) share one local day and offset
+    run_lo = run_hi = 0
+    midnight = 0
+    date_str = ''
+
+    for epoch in epochs:
+        if not run_lo <= epoch < run_hi:
+            if not start <= epoch <= end:
+                raise ValueError(f"Epoch {epoch} is outside the offset table range [{start}, {end}]")
+            index = bisect_right(transitions, epoch) - 1
+            offset = offsets[index]
+            day = (epoch + offset) // 86400
+            # UTC epoch of local midnight under this offset
+            midnight = day * 86400 - offset
+            run_lo = max(midnight, transitions[index])
+            run_hi = min(midnight + 86400,
+                         transitions[index + 1] if index < last_index else end + 1)
+            date_str = date_cache.get(day)
+            if date_str is None:
+                date_str = date_cache[day] = date.fromordinal(day + EPOCH_ORDINAL).isoformat()
+        add_date(date_str)
+        add_time(labels[(epoch - midnight) // 60])
+
+    return dates, times
+
+
 def run_timew_command(args: List[str]) -> str:
     """Execute a timewarrior command and return its output."""
     try: